@@ -1,12 +1,17 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import heapq
 import json
 import os
+import threading
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from deep_translator import GoogleTranslator
 
@@ -16,7 +21,8 @@ class SmartGlassMonitor:
     Smart Glass Industry Monitoring System
     """
     
-    def __init__(self, config_path: str = "smart_glass_config.json", db_path: str = "smart_glass_db.json"):
+    def __init__(self, config_path: str = "smart_glass_config.json", db_path: str = "smart_glass_db.json",
+                 session: Optional[requests.Session] = None):
         # Resolve absolute paths relative to this script file
         base_dir = os.path.dirname(os.path.abspath(__file__))
         self.config_path = os.path.join(base_dir, config_path)
@@ -24,9 +30,42 @@ class SmartGlassMonitor:
         
         self.config = self._load_config()
         self.db = self._load_db()
+        # Index of stored URLs: O(1) dedup checks; persisted with the DB, so dedup spans runs
+        self._seen_urls = {item["url"] for item in self.db["items"]}
+        self._mark_run_time()
         self.api_key = os.environ.get("TAVILY_API_KEY", "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")
         self.base_url = "https://api.tavily.com/search"
-        self.translator = GoogleTranslator(source='auto', target='zh-CN')
+        self._tx_local = threading.local()
+        # Reuse the caller's Session (the daily generator shares its pool); build a retrying one when run standalone
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=10,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=frozenset(["GET", "POST"]),
+                    raise_on_status=False,
+                ),
+            )
+            session.mount("https://", adapter)
+        self.session = session
+
+    @property
+    def translator(self) -> GoogleTranslator:
+        """Per-thread translator, created on first use (GoogleTranslator instances are not thread-safe)"""
+        translator = getattr(self._tx_local, "translator", None)
+        if translator is None:
+            translator = self._tx_local.translator = GoogleTranslator(source='auto', target='zh-CN')
+        return translator
+
+    def _mark_run_time(self):
+        """Record this run's timestamp, shared by every item stored during the run"""
+        self._run_time = datetime.now()
+        self._now_str = self._run_time.strftime("%Y-%m-%d %H:%M:%S")
+        self._today_str = self._run_time.strftime("%Y-%m-%d")
 
     def _load_config(self) -> Dict[str, Any]:
         if os.path.exists(self.config_path):
@@ -59,7 +98,7 @@ class SmartGlassMonitor:
             payload["include_domains"] = domains
 
         try:
-            response = requests.post(self.base_url, json=payload, timeout=30)
+            response = self.session.post(self.base_url, json=payload, timeout=30)
             if response.status_code == 200:
                 return response.json().get("results", [])
         except Exception as e:
@@ -106,7 +145,8 @@ class SmartGlassMonitor:
 
     def run_daily_check(self):
         """Run the daily monitoring task"""
-        print(f"🚀 Starting Smart Glass Daily Monitor at {datetime.now()}")
+        self._mark_run_time()
+        print(f"🚀 Starting Smart Glass Daily Monitor at {self._run_time}")
         
         new_items_count = 0
         
@@ -140,21 +180,25 @@ class SmartGlassMonitor:
 
         print(f"   Prepared {len(search_queries)} search queries to ensure volume...")
         
-        for query_obj in search_queries:
-            print(f"   Searching: {query_obj['q']}...")
+        # Searches are independent network calls: run them concurrently, then
+        # merge results in query order so deduplication stays deterministic
+        print(f"   Searching {len(search_queries)} queries (8 concurrent)...")
+        with ThreadPoolExecutor(max_workers=8) as executor:
             # Get max results possible per query
-            results = self._tavily_search(query_obj['q'], days=30)
+            all_results = executor.map(lambda q: self._tavily_search(q['q'], days=30), search_queries)
             
-            for item in results:
-                item["content"] = self._clean_content(item.get("content", ""))
-                # Use specific category/competitor from query object
-                if self._add_to_db(
-                    item, 
-                    category=query_obj["cat"], 
-                    competitor=query_obj.get("comp"), 
-                    tags=[query_obj.get("tag")]
-                ):
-                    new_items_count += 1
+            for query_obj, results in zip(search_queries, all_results):
+                print(f"   Results for: {query_obj['q']} ({len(results)})")
+                for item in results:
+                    item["content"] = self._clean_content(item.get("content", ""))
+                    # Use specific category/competitor from query object
+                    if self._add_to_db(
+                        item, 
+                        category=query_obj["cat"], 
+                        competitor=query_obj.get("comp"), 
+                        tags=[query_obj.get("tag")]
+                    ):
+                        new_items_count += 1
                     
         self._save_db()
         print(f"✅ Monitor finished. {new_items_count} new items added.")
@@ -167,23 +211,23 @@ class SmartGlassMonitor:
             return False
             
         # Check if exists
-        for existing in self.db["items"]:
-            if existing["url"] == url:
-                return False
+        if url in self._seen_urls:
+            return False
                 
         # Add new item
         new_entry = {
             "url": url,
             "title": item.get("title"),
             "content": item.get("content"),
-            "published_date": item.get("published_date", datetime.now().strftime("%Y-%m-%d")),
-            "fetched_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "published_date": item.get("published_date", self._today_str),
+            "fetched_at": self._now_str,
             "category": category,
             "competitor": competitor,
             "tags": tags or [],
             "score": item.get("score", 0)
         }
         self.db["items"].append(new_entry)
+        self._seen_urls.add(url)
         return True
 
     def _summarize_text(self, text: str) -> str:
@@ -246,11 +290,9 @@ class SmartGlassMonitor:
 
     def get_report_data(self) -> Dict[str, Any]:
         """Get data formatted for the report generation"""
-        # Sort by date (newest first)
-        sorted_items = sorted(self.db["items"], key=lambda x: x["fetched_at"], reverse=True)
-        
-        # Filter for recent items (e.g., last 3 days)
-        recent_items = sorted_items[:20] # Just take top 20 for now
+        # Newest first; only the top 20 are needed, so select them with a bounded heap
+        # (nlargest keeps the same tie order as a stable reverse sort)
+        recent_items = heapq.nlargest(20, self.db["items"], key=lambda x: x["fetched_at"])
         
         competitor_news = [x for x in recent_items if x["category"] == "Competitor"]
         industry_news = [x for x in recent_items if x["category"] == "Industry"]